@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 CHARSET_MAP = {c: i for i, c in enumerate(CHARSET)}
 
+# bytes.translate() table: lowercase bech32 ASCII -> 5-bit value, 0xFF otherwise
+_CHARSET_TABLE = bytearray(b"\xff" * 256)
+for _char, _value in CHARSET_MAP.items():
+    _CHARSET_TABLE[ord(_char)] = _value
+_CHARSET_TABLE = bytes(_CHARSET_TABLE)
+
+# bytes.translate() table: 5-bit value -> bech32 ASCII (entries past 31 are never used)
+_SYMBOL_TABLE = CHARSET.encode("ascii") + bytes(256 - len(CHARSET))
+
+_PRINTABLE_ASCII = bytes(range(33, 127))
+
 MS32_CONST = 0x10CE0795C2FD1E62A
 MS32_LONG_CONST = 0x43381E570BF4798AB26
 
@@ -21,46 +33,66 @@ class CodexError(ValueError):
     """Raised when a codex32 string fails validation."""
 
 
-def _is_single_case(value: str) -> bool:
+def _symbols_to_chars(values: List[int]) -> str:
+    return bytes(values).translate(_SYMBOL_TABLE).decode("ascii")
+
+
+def _is_single_case(value: bytes) -> bool:
     return value == value.lower() or value == value.upper()
 
 
-def _validate_ascii(value: str) -> None:
-    if any(ord(x) < 33 or ord(x) > 126 for x in value):
+def _validate_ascii(value: str) -> bytes:
+    """Return the input as ASCII bytes, rejecting anything outside printable ASCII."""
+    try:
+        raw = value.encode("ascii")
+    except UnicodeEncodeError:
+        raise CodexError("Codex32 input contains invalid characters") from None
+    if raw.translate(None, _PRINTABLE_ASCII):
         raise CodexError("Codex32 input contains invalid characters")
+    return raw
+
+
+def _generator_table(gen: List[int]) -> tuple[int, ...]:
+    """XOR of the generator terms selected by each 5-bit overflow value."""
+    table = []
+    for b in range(32):
+        term = 0
+        for i in range(5):
+            term ^= gen[i] if ((b >> i) & 1) else 0
+        table.append(term)
+    return tuple(table)
+
+
+MS32_GEN_TABLE = _generator_table([
+    0x19DC500CE73FDE210,
+    0x1BFAE00DEF77FE529,
+    0x1FBD920FFFE7BEE52,
+    0x1739640BDEEE3FDAD,
+    0x07729A039CFC75F5A,
+])
+
+MS32_LONG_GEN_TABLE = _generator_table([
+    0x3D59D273535EA62D897,
+    0x7A9BECB6361C6C51507,
+    0x543F9B7E6C38D8A2A0E,
+    0x0C577EAECCF1990D13C,
+    0x1887F74F8DC71B10651,
+])
 
 
 def ms32_polymod(values: Iterable[int]) -> int:
-    gen = [
-        0x19DC500CE73FDE210,
-        0x1BFAE00DEF77FE529,
-        0x1FBD920FFFE7BEE52,
-        0x1739640BDEEE3FDAD,
-        0x07729A039CFC75F5A,
-    ]
     residue = 0x23181B3
     for v in values:
         b = residue >> 60
-        residue = (residue & 0x0FFFFFFFFFFFFFFF) << 5 ^ v
-        for i in range(5):
-            residue ^= gen[i] if ((b >> i) & 1) else 0
+        residue = (residue & 0x0FFFFFFFFFFFFFFF) << 5 ^ v ^ MS32_GEN_TABLE[b]
     return residue
 
 
 def ms32_long_polymod(values: Iterable[int]) -> int:
-    gen = [
-        0x3D59D273535EA62D897,
-        0x7A9BECB6361C6C51507,
-        0x543F9B7E6C38D8A2A0E,
-        0x0C577EAECCF1990D13C,
-        0x1887F74F8DC71B10651,
-    ]
     residue = 0x23181B3
     for v in values:
         b = residue >> 70
-        residue = (residue & 0x3FFFFFFFFFFFFFFFFF) << 5 ^ v
-        for i in range(5):
-            residue ^= gen[i] if ((b >> i) & 1) else 0
+        residue = (residue & 0x3FFFFFFFFFFFFFFFFF) << 5 ^ v ^ MS32_LONG_GEN_TABLE[b]
     return residue
 
 
@@ -90,7 +122,7 @@ def ms32_create_checksum(data: List[int]) -> List[int]:
 
 def ms32_encode(data: List[int]) -> str:
     combined = data + ms32_create_checksum(data)
-    return "ms1" + "".join(CHARSET[d] for d in combined)
+    return "ms1" + _symbols_to_chars(combined)
 
 
 def _checksum_length(data_values: List[int]) -> int:
@@ -98,31 +130,33 @@ def _checksum_length(data_values: List[int]) -> int:
 
 
 def _decode_data_values(codex_str: str) -> tuple[List[int], str]:
-    _validate_ascii(codex_str)
-    if not _is_single_case(codex_str):
+    # Work on one ASCII bytes copy; symbols are only turned into ints at the end
+    raw = _validate_ascii(codex_str)
+    if not _is_single_case(raw):
         raise CodexError("Codex32 input must be single-case")
 
-    case = "upper" if codex_str == codex_str.upper() else "lower"
-    codex = codex_str.lower()
-    pos = codex.rfind("1")
+    case = "upper" if raw == raw.upper() else "lower"
+    codex = raw.lower()
+    pos = codex.rfind(b"1")
     if pos < 2 or not (48 <= len(codex) <= 127):
         raise CodexError("Codex32 input has invalid length")
-    if codex[:pos] != "ms":
+    if codex[:pos] != b"ms":
         raise CodexError("Codex32 input must start with ms1")
 
     data_part = codex[pos + 1 :]
     if not data_part:
         raise CodexError("Codex32 input missing data payload")
-    if not all(x in CHARSET for x in data_part):
+    data_symbols = data_part.translate(_CHARSET_TABLE)
+    if 0xFF in data_symbols:
         raise CodexError("Codex32 input has non-bech32 characters")
 
-    threshold_char = data_part[0]
-    if threshold_char not in "023456789":
+    threshold_char = data_part[:1]
+    if threshold_char not in b"023456789":
         raise CodexError("Codex32 threshold must be 0 or 2-9")
-    if threshold_char == "0" and len(data_part) > 5 and data_part[5] != "s":
+    if threshold_char == b"0" and len(data_part) > 5 and data_part[5:6] != b"s":
         raise CodexError("Codex32 share index must be 's' when threshold is 0")
 
-    data_values = [CHARSET_MAP[c] for c in data_part]
+    data_values = list(data_symbols)
     if not ms32_verify_checksum(data_values):
         raise CodexError("Codex32 checksum failed")
 
@@ -143,16 +177,32 @@ def _payload_to_bytes(payload_values: List[int]) -> bytes:
     return bytes(out)
 
 
+# GF(32) antilog/log tables for the generator x (mod x^5 + x^3 + 1); EXP is doubled so
+# EXP[LOG[a] + LOG[b]] never needs a "% 31"
+BECH32_EXP = [0] * 62
+BECH32_LOG = [0] * 32
+_power = 1
+for _exponent in range(31):
+    BECH32_EXP[_exponent] = BECH32_EXP[_exponent + 31] = _power
+    BECH32_LOG[_power] = _exponent
+    _power <<= 1
+    _power ^= 41 if _power & 32 else 0
+
+# Flat 32x32 GF(32) product table indexed by (a << 5) | b
+BECH32_MUL_TABLE = bytes(
+    BECH32_EXP[BECH32_LOG[a] + BECH32_LOG[b]] if a and b else 0
+    for a in range(32)
+    for b in range(32)
+)
+
+
 def bech32_mul(a: int, b: int) -> int:
-    res = 0
-    for i in range(5):
-        res ^= a if ((b >> i) & 1) else 0
-        a *= 2
-        a ^= 41 if (32 <= a) else 0
-    return res
+    return BECH32_MUL_TABLE[(a << 5) | b]
 
 
-def bech32_lagrange(indices: List[int], x: int) -> List[int]:
+# Weights depend only on the ordered share indices and x, not on share data
+@lru_cache(maxsize=64)
+def _lagrange_weights(indices: Tuple[int, ...], x: int) -> Tuple[int, ...]:
     n = 1
     coeffs: List[int] = []
     for i in indices:
@@ -161,16 +211,20 @@ def bech32_lagrange(indices: List[int], x: int) -> List[int]:
         for j in indices:
             m = bech32_mul(m, (x if i == j else i) ^ j)
         coeffs.append(m)
-    return [bech32_mul(n, BECH32_INV[i]) for i in coeffs]
+    return tuple(bech32_mul(n, BECH32_INV[i]) for i in coeffs)
+
+
+def bech32_lagrange(indices: List[int], x: int) -> List[int]:
+    return list(_lagrange_weights(tuple(indices), x))
 
 
 def ms32_interpolate(shares: List[List[int]], x: int) -> List[int]:
-    weights = bech32_lagrange([s[5] for s in shares], x)
+    weights = _lagrange_weights(tuple(s[5] for s in shares), x)
     res: List[int] = []
     for i in range(len(shares[0])):
         n = 0
         for j in range(len(shares)):
-            n ^= bech32_mul(weights[j], shares[j][i])
+            n ^= BECH32_MUL_TABLE[(weights[j] << 5) | shares[j][i]]
         res.append(n)
     return res
 
@@ -183,13 +237,13 @@ class Codex32String:
         data_values, case = _decode_data_values(self.value)
         checksum_len = _checksum_length(data_values)
         data_part_values = data_values[:-checksum_len]
-        data_part_chars = [CHARSET[v] for v in data_part_values]
+        data_part_chars = _symbols_to_chars(data_part_values)
 
         self._case = case
         self._data_part_values = data_part_values
         self.hrp = "ms"
         self.k = data_part_chars[0]
-        self.ident = "".join(data_part_chars[1:5])
+        self.ident = data_part_chars[1:5]
         self.share_idx = data_part_chars[5]
         self._payload_values = data_part_values[6:]
         self.data = _payload_to_bytes(self._payload_values)
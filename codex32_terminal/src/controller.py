@@ -17,7 +17,7 @@ from model import (
     SCRIPT_TAPROOT,
     build_multisig_cosigner_export,
     build_single_sig_export,
-    codex32_to_seed_bytes,
+    codex32_share_to_seed_bytes,
     get_seed_fingerprint,
     normalize_network,
     parse_codex32_share,
@@ -222,19 +222,18 @@ def _load_seed_from_entry(entry_mode: str, initial_share: str | None = None) ->
 
         if first_share.share_idx.lower() == "s":
             try:
-                seed_bytes = codex32_to_seed_bytes(first_share.s)
+                seed_bytes = codex32_share_to_seed_bytes(first_share)
             except Codex32InputError as exc:
                 view.display_error(str(exc))
                 view.wait_for_retry()
                 continue
             return seed_bytes, None
 
-        try:
-            threshold = int(first_share.k)
-        except ValueError:
+        if not first_share.k.isdigit():
             view.display_error("Invalid threshold value in share header.")
             view.wait_for_retry()
             continue
+        threshold = int(first_share.k)
         if threshold < 2:
             view.display_error("Threshold must be >= 2 for split shares.")
             view.wait_for_retry()
@@ -274,7 +273,7 @@ def _load_seed_from_entry(entry_mode: str, initial_share: str | None = None) ->
 
         try:
             secret = recover_secret_share(shares)
-            seed_bytes = codex32_to_seed_bytes(secret.s)
+            seed_bytes = codex32_share_to_seed_bytes(secret)
         except Codex32InputError as exc:
             view.display_error(str(exc))
             view.wait_for_retry()
@@ -31,10 +31,13 @@ SCRIPT_DISPLAY_NAMES = {
     SCRIPT_TAPROOT: "Taproot (BIP86)",
 }
 
+_HARDENED = 0x80000000
+_MULTISIG_PURPOSE_INDEX = 48
+
 _SINGLE_SIG_PURPOSE = {
-    SCRIPT_NESTED: "49'",
-    SCRIPT_NATIVE: "84'",
-    SCRIPT_TAPROOT: "86'",
+    SCRIPT_NESTED: 49,
+    SCRIPT_NATIVE: 84,
+    SCRIPT_TAPROOT: 86,
 }
 
 _SINGLE_SIG_WRAPPERS = {
@@ -44,8 +47,8 @@ _SINGLE_SIG_WRAPPERS = {
 }
 
 _MULTISIG_PURPOSE = {
-    MULTISIG_SCRIPT_NESTED: "1'",
-    MULTISIG_SCRIPT_NATIVE: "2'",
+    MULTISIG_SCRIPT_NESTED: 1,
+    MULTISIG_SCRIPT_NATIVE: 2,
 }
 
 _MULTISIG_WRAPPERS = {
@@ -53,6 +56,10 @@ _MULTISIG_WRAPPERS = {
     MULTISIG_SCRIPT_NATIVE: "wsh(sortedmulti({threshold},{keys}))",
 }
 
+# Leading "psbt" magic bytes as they start a base64 / hex encoded PSBT
+_PSBT_TEXT_PREFIXES = ("cHNidP", "70736274")
+_MAX_PSBT_PATH_LENGTH = 4096
+
 
 def sanitize_codex32_input(raw: str) -> str:
     """Normalize user input by removing whitespace and separators."""
@@ -82,7 +89,10 @@ def parse_codex32_share(codex_str: str, expected_len: int = 48) -> Codex32String
 
 def validate_codex32_s_share(codex_str: str, expected_len: int = 48) -> Codex32String:
     """Validate a codex32 S-share string and return a Codex32String object."""
-    codex = parse_codex32_share(codex_str, expected_len)
+    return _check_s_share(parse_codex32_share(codex_str, expected_len))
+
+
+def _check_s_share(codex: Codex32String) -> Codex32String:
     if codex.share_idx.lower() != "s":
         raise Codex32InputError(
             f"Share index must be 's' for an unshared secret, got '{codex.share_idx}'"
@@ -100,6 +110,11 @@ def codex32_to_seed_bytes(codex_str: str) -> bytes:
     return codex.data
 
 
+def codex32_share_to_seed_bytes(codex: Codex32String) -> bytes:
+    """Return seed bytes from an already-parsed S-share without re-parsing it."""
+    return _check_s_share(codex).data
+
+
 def normalize_network(network: str) -> str:
     """Validate and normalize supported CLI network names."""
     cleaned = (network or "").strip().lower()
@@ -140,22 +155,40 @@ def get_embit_network_name(network: str) -> str:
     return "test"
 
 
-def get_single_sig_account_derivation(script_type: str, network: str) -> str:
-    """Return BIP49/84/86 account derivation path for the selected network."""
+def _get_coin_type(network: str) -> int:
+    return 0 if normalize_network(network) == NETWORK_MAINNET else 1
+
+
+def _format_derivation_path(indices: tuple[int, ...]) -> str:
+    parts = [f"{index - _HARDENED}'" if index >= _HARDENED else str(index) for index in indices]
+    return "/".join(["m", *parts])
+
+
+def _get_single_sig_account_indices(script_type: str, network: str) -> tuple[int, ...]:
     normalized_script = normalize_single_sig_script_type(script_type)
-    normalized_network = normalize_network(network)
-    coin_type = "0'" if normalized_network == NETWORK_MAINNET else "1'"
     purpose = _SINGLE_SIG_PURPOSE[normalized_script]
-    return f"m/{purpose}/{coin_type}/0'"
+    return (purpose | _HARDENED, _get_coin_type(network) | _HARDENED, _HARDENED)
 
 
-def get_multisig_account_derivation(script_type: str, network: str) -> str:
-    """Return BIP48 account derivation path for nested/native multisig."""
+def _get_multisig_account_indices(script_type: str, network: str) -> tuple[int, ...]:
     normalized_script = normalize_multisig_script_type(script_type)
-    normalized_network = normalize_network(network)
-    coin_type = "0'" if normalized_network == NETWORK_MAINNET else "1'"
     script_path = _MULTISIG_PURPOSE[normalized_script]
-    return f"m/48'/{coin_type}/0'/{script_path}"
+    return (
+        _MULTISIG_PURPOSE_INDEX | _HARDENED,
+        _get_coin_type(network) | _HARDENED,
+        _HARDENED,
+        script_path | _HARDENED,
+    )
+
+
+def get_single_sig_account_derivation(script_type: str, network: str) -> str:
+    """Return BIP49/84/86 account derivation path for the selected network."""
+    return _format_derivation_path(_get_single_sig_account_indices(script_type, network))
+
+
+def get_multisig_account_derivation(script_type: str, network: str) -> str:
+    """Return BIP48 account derivation path for nested/native multisig."""
+    return _format_derivation_path(_get_multisig_account_indices(script_type, network))
 
 
 def _validate_multisig_policy(threshold: int, total_cosigners: int) -> tuple[int, int]:
@@ -175,40 +208,62 @@ def _build_multisig_placeholders(total_cosigners: int, branch_name: str) -> list
     return placeholders
 
 
-def get_seed_fingerprint(seed_bytes: bytes, network: str) -> str:
-    """Return the master fingerprint for the supplied seed bytes."""
+def _check_master_seed(seed_bytes: bytes) -> None:
     if len(seed_bytes) != 16:
         raise Codex32InputError(
             f"Expected 16-byte Codex32 master seed, got {len(seed_bytes)} bytes"
         )
+
+
+def _build_root(seed_bytes: bytes, network: str) -> bip32.HDKey:
     embit_network = get_embit_network_name(network)
-    root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS[embit_network]["xprv"])
-    return hexlify(root.child(0).fingerprint).decode("utf-8")
+    return bip32.HDKey.from_seed(seed_bytes, version=NETWORKS[embit_network]["xprv"])
 
 
-def derive_account_xpub(seed_bytes: bytes, derivation_path: str, network: str) -> str:
-    """Derive an account-level xpub/tpub string for a derivation path."""
+def _root_fingerprint(root: bip32.HDKey) -> str:
+    return hexlify(root.my_fingerprint).decode("utf-8")
+
+
+def _derive_account_xpub(
+    root: bip32.HDKey,
+    derivation_path: str | tuple[int, ...],
+    network: str,
+) -> str:
+    # embit parses string paths on every call; index tuples skip that step
     embit_network = get_embit_network_name(network)
-    root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS[embit_network]["xprv"])
     xpub = root.derive(derivation_path).to_public()
     return xpub.to_string(version=NETWORKS[embit_network]["xpub"])
 
 
-def build_single_sig_export(seed_bytes: bytes, script_type: str, network: str) -> dict[str, str]:
-    """Build standard single-sig descriptor export artifacts for the loaded seed."""
-    normalized_script = normalize_single_sig_script_type(script_type)
-    derivation_path = get_single_sig_account_derivation(normalized_script, network)
-    fingerprint = get_seed_fingerprint(seed_bytes, network)
-    xpub = derive_account_xpub(seed_bytes, derivation_path, network)
+def get_seed_fingerprint(seed_bytes: bytes, network: str) -> str:
+    """Return the master fingerprint for the supplied seed bytes."""
+    _check_master_seed(seed_bytes)
+    return _root_fingerprint(_build_root(seed_bytes, network))
+
+
+def derive_account_xpub(seed_bytes: bytes, derivation_path: str, network: str) -> str:
+    """Derive an account-level xpub/tpub string for a derivation path."""
+    return _derive_account_xpub(_build_root(seed_bytes, network), derivation_path, network)
+
+
+def _finish_single_sig(
+    root: bip32.HDKey,
+    fingerprint: str,
+    script_type: str,
+    network: str,
+) -> dict[str, str]:
+    account_indices = _get_single_sig_account_indices(script_type, network)
+    derivation_path = _format_derivation_path(account_indices)
+    xpub = _derive_account_xpub(root, account_indices, network)
 
     origin_path = derivation_path[2:] if derivation_path.startswith("m/") else derivation_path
     receive_key = f"[{fingerprint}/{origin_path}]{xpub}/0/*"
     change_key = f"[{fingerprint}/{origin_path}]{xpub}/1/*"
-    wrapper = _SINGLE_SIG_WRAPPERS[normalized_script]
+    wrapper = _SINGLE_SIG_WRAPPERS[script_type]
 
     return {
-        "script_type": normalized_script,
-        "script_display": SCRIPT_DISPLAY_NAMES[normalized_script],
+        "script_type": script_type,
+        "script_display": SCRIPT_DISPLAY_NAMES[script_type],
         "network": normalize_network(network),
         "fingerprint": fingerprint,
         "derivation_path": derivation_path,
@@ -218,18 +273,43 @@ def build_single_sig_export(seed_bytes: bytes, script_type: str, network: str) -
     }
 
 
+def build_single_sig_export(seed_bytes: bytes, script_type: str, network: str) -> dict[str, str]:
+    """Build standard single-sig descriptor export artifacts for the loaded seed."""
+    normalized_script = normalize_single_sig_script_type(script_type)
+    _check_master_seed(seed_bytes)
+    root = _build_root(seed_bytes, network)
+    return _finish_single_sig(root, _root_fingerprint(root), normalized_script, network)
+
+
+def build_all_single_sig_exports(seed_bytes: bytes, network: str) -> dict[str, dict[str, str]]:
+    """Build single-sig exports for every supported script type from one root key."""
+    _check_master_seed(seed_bytes)
+    root = _build_root(seed_bytes, network)
+    fingerprint = _root_fingerprint(root)
+    return {
+        script_type: _finish_single_sig(root, fingerprint, script_type, network)
+        for script_type in _SINGLE_SIG_PURPOSE
+    }
+
+
 def build_multisig_cosigner_export(
     seed_bytes: bytes,
     script_type: str,
     network: str,
     threshold: int | None = None,
     total_cosigners: int | None = None,
+    root: bip32.HDKey | None = None,
 ) -> dict[str, str]:
     """Build nested/native multisig cosigner export artifacts for the loaded seed."""
     normalized_script = normalize_multisig_script_type(script_type)
-    derivation_path = get_multisig_account_derivation(normalized_script, network)
-    fingerprint = get_seed_fingerprint(seed_bytes, network)
-    xpub = derive_account_xpub(seed_bytes, derivation_path, network)
+    account_indices = _get_multisig_account_indices(normalized_script, network)
+    derivation_path = _format_derivation_path(account_indices)
+    _check_master_seed(seed_bytes)
+    # Callers that already hold the root for seed_bytes can skip rebuilding it
+    if root is None:
+        root = _build_root(seed_bytes, network)
+    fingerprint = _root_fingerprint(root)
+    xpub = _derive_account_xpub(root, account_indices, network)
 
     origin_path = derivation_path[2:] if derivation_path.startswith("m/") else derivation_path
     key_origin = f"[{fingerprint}/{origin_path}]{xpub}"
@@ -310,12 +390,27 @@ def _parse_psbt_text_input(raw_input: str) -> psbt.PSBT:
         ) from exc
 
 
+def _cannot_be_psbt_path(raw_value: str) -> bool:
+    return len(raw_value) > _MAX_PSBT_PATH_LENGTH or "\n" in raw_value
+
+
 def parse_psbt_input(psbt_input: str) -> psbt.PSBT:
     """Parse PSBT from direct base64/hex text or from a file path."""
     raw_value = (psbt_input or "").strip()
     if not raw_value:
         raise Codex32InputError("PSBT input is empty.")
 
+    # Skip filesystem probes for payloads that could never be a usable path
+    if _cannot_be_psbt_path(raw_value):
+        return _parse_psbt_text_input(raw_value)
+
+    # Magic-prefixed text usually decodes directly; file names may share the prefix
+    if raw_value.startswith(_PSBT_TEXT_PREFIXES):
+        try:
+            return _parse_psbt_text_input(raw_value)
+        except Codex32InputError:
+            pass
+
     candidate_path = Path(raw_value)
     if candidate_path.exists() and candidate_path.is_file():
         data = candidate_path.read_bytes()
@@ -330,10 +425,7 @@ def parse_psbt_input(psbt_input: str) -> psbt.PSBT:
 
 def sign_psbt_with_seed(seed_bytes: bytes, network: str, psbt_input: str) -> dict[str, str | int]:
     """Sign a PSBT with the loaded Codex32 seed and return signed export strings."""
-    if len(seed_bytes) != 16:
-        raise Codex32InputError(
-            f"Expected 16-byte Codex32 master seed, got {len(seed_bytes)} bytes"
-        )
+    _check_master_seed(seed_bytes)
 
     parsed_psbt = parse_psbt_input(psbt_input)
     missing_utxo_inputs = _get_inputs_missing_utxo(parsed_psbt)
@@ -344,8 +436,7 @@ def sign_psbt_with_seed(seed_bytes: bytes, network: str, psbt_input: str) -> dic
             f"for input(s): {missing_list}. Re-export PSBT with full input data before signing."
         )
 
-    embit_network = get_embit_network_name(network)
-    root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS[embit_network]["xprv"])
+    root = _build_root(seed_bytes, network)
 
     before_count = _count_psbt_signatures(parsed_psbt)
     try:
@@ -2,38 +2,134 @@
 
 from __future__ import annotations
 
+import io
+import os
+import sys
+
+_INTERACTIVE = sys.stdout.isatty()
+# CODEX32_QUIET=1 suppresses informational output for scripted runs (errors still print)
+_QUIET = os.environ.get("CODEX32_QUIET") == "1"
+
+# Longest codex32 string is 127 characters; progress slices this instead of rebuilding it
+_PROGRESS_PLACEHOLDER = "_" * 127
+
+_MAIN_MENU_OPTIONS = (
+    "  1) Export single-sig descriptor\n"
+    "  2) Export multisig cosigner\n"
+    "  3) Sign PSBT\n"
+    "  4) Show loaded seed details\n"
+    "  5) Load new key\n"
+    "  6) Show loaded keys\n"
+    "  7) Exit"
+)
+
+_SINGLE_SIG_SCRIPT_MENU = (
+    "\nSingle-sig script type:\n"
+    "  1) Nested Segwit (BIP49)\n"
+    "  2) Native Segwit (BIP84)\n"
+    "  3) Taproot (BIP86)\n"
+    "  [Enter/b] Back"
+)
+
+_MULTISIG_SCRIPT_MENU = (
+    "\nMultisig script type:\n"
+    "  1) Nested Segwit (BIP48 /1')\n"
+    "  2) Native Segwit (BIP48 /2')\n"
+    "  [Enter/b] Back"
+)
+
+_SINGLE_SIG_EXPORT_TEMPLATE = (
+    "\nSingle-sig export\n"
+    "Script: {script_display}\n"
+    "Network: {network}\n"
+    "Fingerprint: {fingerprint}\n"
+    "Derivation: {derivation_path}\n"
+    "Xpub: {xpub}\n"
+    "Receive descriptor:\n"
+    "{receive_descriptor}\n"
+    "Change descriptor:\n"
+    "{change_descriptor}"
+)
+
+_MULTISIG_EXPORT_TEMPLATE = (
+    "\nMultisig cosigner export\n"
+    "Script: {script_display}\n"
+    "Network: {network}\n"
+    "Fingerprint: {fingerprint}\n"
+    "Derivation: {derivation_path}\n"
+    "Xpub: {xpub}\n"
+    "Key origin: {key_origin}\n"
+    "Cosigner receive key:\n"
+    "{receive_key}\n"
+    "Cosigner change key:\n"
+    "{change_key}"
+)
+
+_MULTISIG_POLICY_EXPORT_TEMPLATE = (
+    _MULTISIG_EXPORT_TEMPLATE + "\n"
+    "Policy: {policy}\n"
+    "Receive descriptor template:\n"
+    "{receive_descriptor_template}\n"
+    "Change descriptor template:\n"
+    "{change_descriptor_template}"
+)
+
+# Prompt lines collect here and are written in one go right before input()
+_PBUF = io.StringIO()
+
+
+def _emit(lines: list[str]) -> None:
+    if _QUIET:
+        return
+    # One write + flush per block instead of one per print() line
+    sys.stdout.write("\n".join(lines) + "\n")
+    if _INTERACTIVE:
+        sys.stdout.flush()
+
+
+def _pprint(text: str = "") -> None:
+    _PBUF.write(f"{text}\n")
+
+
+def _input(prompt: str) -> str:
+    if _PBUF.tell():
+        sys.stdout.write(_PBUF.getvalue())
+        _PBUF.seek(0)
+        _PBUF.truncate()
+        sys.stdout.flush()
+    return input(prompt)
+
 
 def display_welcome(entry_mode: str, network: str) -> None:
-    print("Codex32 BIP32 terminal (v1)")
-    print(f"Network: {network}")
+    lines = ["Codex32 BIP32 terminal (v1)", f"Network: {network}"]
     if entry_mode == "full":
-        print("Paste full shares. Ctrl+C or /cancel cancels.")
+        lines.append("Paste full shares. Ctrl+C or /cancel cancels.")
     else:
-        print("Enter characters box-by-box. Prefix 'MS1' is pre-filled.")
-        print("Use Backspace (empty input) or '<' to go back. Ctrl+C or /cancel cancels.")
+        lines.append("Enter characters box-by-box. Prefix 'MS1' is pre-filled.")
+        lines.append("Use Backspace (empty input) or '<' to go back. Ctrl+C or /cancel cancels.")
+    _emit(lines)
 
 
 def display_progress(current: str, total_len: int) -> None:
     remaining = max(0, total_len - len(current))
-    progress = f"{current}{'_' * remaining}"
-    print(f"Progress: {progress}")
+    _emit([f"Progress: {current}{_PROGRESS_PLACEHOLDER[:remaining]}"])
 
 
 def display_share_prompt(index: int, total: int) -> None:
-    print(f"\nEnter share {index} of {total}:")
+    _emit(["", f"Enter share {index} of {total}:"])
 
 
 def display_full_share_hint(prefix: str | None) -> None:
     if prefix:
-        print(f"Prefix hint: {prefix}...")
+        _emit([f"Prefix hint: {prefix}..."])
 
 
 def get_box_input(box_number: int) -> str:
-    return input(f"Box {box_number:02d} (/cancel to abort): ")
+    return _input(f"Box {box_number:02d} (/cancel to abort): ")
 
 
 def get_full_share_input() -> str:
-    return input("Paste full codex32 share (/cancel to abort): ")
+    return _input("Paste full codex32 share (/cancel to abort): ")
 
 
 def display_error(message: str) -> None:
@@ -41,31 +137,29 @@ def display_error(message: str) -> None:
 
 
 def display_info(message: str) -> None:
-    print(message)
+    _emit([message])
 
 
 def display_preview(codex_str: str) -> None:
-    print("\nPreview:")
-    print(codex_str)
+    # Context for the confirm() that follows, so shown even in quiet mode
+    _pprint(f"\nPreview:\n{codex_str}")
 
 
 def confirm(prompt: str) -> bool:
-    response = input(f"{prompt} [y/N]: ").strip().lower()
+    response = _input(f"{prompt} [y/N]: ").strip().lower()
     return response in {"y", "yes"}
 
 
 def display_correction(original: str, corrected: str) -> None:
-    print("\nCorrection candidate found:")
-    print(f"Original:  {original}")
-    print(f"Corrected: {corrected}")
+    _pprint(f"\nCorrection candidate found:\nOriginal:  {original}\nCorrected: {corrected}")
 
 
 def wait_for_retry() -> None:
-    input("Press Enter to try again...")
+    _input("Press Enter to try again...")
 
 
 def display_cancelled() -> None:
-    print("Entry cancelled.")
+    _emit(["Entry cancelled."])
 
 
 def display_session_loaded(
@@ -74,132 +168,108 @@ def display_session_loaded(
     network: str,
     recovered_share: str | None = None,
 ) -> None:
-    print("\nCodex32 seed loaded.")
-    print(f"Seed (hex): {seed_bytes.hex()}")
-    print(f"Fingerprint: {fingerprint}")
-    print(f"Network: {network}")
+    lines = [
+        "",
+        "Codex32 seed loaded.",
+        f"Seed (hex): {seed_bytes.hex()}",
+        f"Fingerprint: {fingerprint}",
+        f"Network: {network}",
+    ]
     if recovered_share:
-        print(f"Recovered S-share: {recovered_share}")
+        lines.append(f"Recovered S-share: {recovered_share}")
+    _emit(lines)
 
 
 def prompt_main_menu_choice(active_fingerprint: str, loaded_count: int) -> str:
-    print("\nActions:")
-    print(f"Active key fingerprint: {active_fingerprint}")
-    print(f"Loaded keys: {loaded_count}")
-    print("  1) Export single-sig descriptor")
-    print("  2) Export multisig cosigner")
-    print("  3) Sign PSBT")
-    print("  4) Show loaded seed details")
-    print("  5) Load new key")
-    print("  6) Show loaded keys")
-    print("  7) Exit")
-    return input("Select action [1-7]: ").strip().lower()
+    _pprint(
+        f"\nActions:\nActive key fingerprint: {active_fingerprint}\n"
+        f"Loaded keys: {loaded_count}\n{_MAIN_MENU_OPTIONS}"
+    )
+    return _input("Select action [1-7]: ").strip().lower()
 
 
 def display_loaded_keys(fingerprints: list[str], active_index: int) -> None:
-    print("\nLoaded keys:")
+    lines = ["", "Loaded keys:"]
     for index, fingerprint in enumerate(fingerprints, start=1):
         active_marker = " (active)" if (index - 1) == active_index else ""
-        print(f"  {index}) {fingerprint}{active_marker}")
+        lines.append(f"  {index}) {fingerprint}{active_marker}")
+    _emit(lines)
 
 
 def prompt_switch_loaded_key_choice() -> str:
-    print("Enter list number or fingerprint to make active. [Enter/b] Back")
-    return input("Activate key: ").strip().lower()
+    _pprint("Enter list number or fingerprint to make active. [Enter/b] Back")
+    return _input("Activate key: ").strip().lower()
 
 
 def prompt_single_sig_script_type() -> str:
-    print("\nSingle-sig script type:")
-    print("  1) Nested Segwit (BIP49)")
-    print("  2) Native Segwit (BIP84)")
-    print("  3) Taproot (BIP86)")
-    print("  [Enter/b] Back")
-    return input("Select script type: ").strip().lower()
+    _pprint(_SINGLE_SIG_SCRIPT_MENU)
+    return _input("Select script type: ").strip().lower()
 
 
 def display_single_sig_export(export_data: dict[str, str]) -> None:
-    print("\nSingle-sig export")
-    print(f"Script: {export_data['script_display']}")
-    print(f"Network: {export_data['network']}")
-    print(f"Fingerprint: {export_data['fingerprint']}")
-    print(f"Derivation: {export_data['derivation_path']}")
-    print(f"Xpub: {export_data['xpub']}")
-    print("Receive descriptor:")
-    print(export_data["receive_descriptor"])
-    print("Change descriptor:")
-    print(export_data["change_descriptor"])
+    _emit([_SINGLE_SIG_EXPORT_TEMPLATE.format(**export_data)])
 
 
 def prompt_multisig_script_type() -> str:
-    print("\nMultisig script type:")
-    print("  1) Nested Segwit (BIP48 /1')")
-    print("  2) Native Segwit (BIP48 /2')")
-    print("  [Enter/b] Back")
-    return input("Select script type: ").strip().lower()
+    _pprint(_MULTISIG_SCRIPT_MENU)
+    return _input("Select script type: ").strip().lower()
 
 
 def prompt_multisig_policy() -> str:
-    print("\nOptional multisig policy template (press Enter to skip):")
-    print("  Example: 2/3")
-    return input("Policy m/n: ").strip()
+    _pprint("\nOptional multisig policy template (press Enter to skip):")
+    _pprint("  Example: 2/3")
+    return _input("Policy m/n: ").strip()
 
 
 def display_multisig_cosigner_export(export_data: dict[str, str]) -> None:
-    print("\nMultisig cosigner export")
-    print(f"Script: {export_data['script_display']}")
-    print(f"Network: {export_data['network']}")
-    print(f"Fingerprint: {export_data['fingerprint']}")
-    print(f"Derivation: {export_data['derivation_path']}")
-    print(f"Xpub: {export_data['xpub']}")
-    print(f"Key origin: {export_data['key_origin']}")
-    print("Cosigner receive key:")
-    print(export_data["receive_key"])
-    print("Cosigner change key:")
-    print(export_data["change_key"])
     if "policy" in export_data:
-        print(f"Policy: {export_data['policy']}")
-        print("Receive descriptor template:")
-        print(export_data["receive_descriptor_template"])
-        print("Change descriptor template:")
-        print(export_data["change_descriptor_template"])
+        template = _MULTISIG_POLICY_EXPORT_TEMPLATE
+    else:
+        template = _MULTISIG_EXPORT_TEMPLATE
+    _emit([template.format(**export_data)])
 
 
 def prompt_psbt_input() -> str:
-    print("\nPSBT input")
-    print("- Paste base64 PSBT")
-    print("- OR paste hex PSBT")
-    print("- OR paste a local file path containing PSBT bytes/base64/hex")
-    print("- Press Enter to cancel")
-    return input("PSBT input: ").strip()
+    _pprint("\nPSBT input")
+    _pprint("- Paste base64 PSBT")
+    _pprint("- OR paste hex PSBT")
+    _pprint("- OR paste a local file path containing PSBT bytes/base64/hex")
+    _pprint("- Press Enter to cancel")
+    return _input("PSBT input: ").strip()
 
 
 def display_psbt_sign_result(sign_result: dict[str, str | int]) -> None:
-    print("\nPSBT signed.")
-    print(f"Network: {sign_result['network']}")
-    print(f"Signatures added: {sign_result['signatures_added']}")
-    print(f"Total signatures: {sign_result['total_signatures']}")
-    print("Signed PSBT (base64):")
-    print(sign_result["signed_psbt_base64"])
+    _emit(
+        [
+            "",
+            "PSBT signed.",
+            f"Network: {sign_result['network']}",
+            f"Signatures added: {sign_result['signatures_added']}",
+            f"Total signatures: {sign_result['total_signatures']}",
+            "Signed PSBT (base64):",
+            str(sign_result["signed_psbt_base64"]),
+        ]
+    )
 
 
 def prompt_signed_psbt_output_directory() -> str:
-    print("Save location (directory path). Press Enter for current directory.")
-    return input("Output directory: ").strip()
+    _pprint("Save location (directory path). Press Enter for current directory.")
+    return _input("Output directory: ").strip()
 
 
 def prompt_signed_psbt_output_filename() -> str:
-    print("Enter output file name without extension (example: signed_test1)")
-    print("The tool automatically saves with .psbt extension.")
-    return input("Output file name: ").strip()
+    _pprint("Enter output file name without extension (example: signed_test1)")
+    _pprint("The tool automatically saves with .psbt extension.")
+    return _input("Output file name: ").strip()
 
 
 def display_saved_psbt_path(saved_path: str) -> None:
-    print(f"Saved signed PSBT binary to: {saved_path}")
+    _emit([f"Saved signed PSBT binary to: {saved_path}"])
 
 
 def wait_for_continue() -> None:
-    input("Press Enter to return to menu...")
+    _input("Press Enter to return to menu...")
 
 
 def display_goodbye() -> None:
-    print("Session ended.")
+    _emit(["Session ended."])
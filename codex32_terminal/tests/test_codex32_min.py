@@ -0,0 +1,69 @@
+"""Table checks for the GF(32) arithmetic in codex32_min."""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from codex32_min import (  # noqa: E402
+    BECH32_EXP,
+    BECH32_INV,
+    BECH32_LOG,
+    BECH32_MUL_TABLE,
+    CHARSET_MAP,
+    bech32_lagrange,
+    bech32_mul,
+)
+
+
+def _reference_mul(a: int, b: int) -> int:
+    """Bit-by-bit GF(32) multiply (the original bech32_mul loop)."""
+    res = 0
+    for i in range(5):
+        res ^= a if ((b >> i) & 1) else 0
+        a *= 2
+        a ^= 41 if (32 <= a) else 0
+    return res
+
+
+class TestBech32FieldTables(unittest.TestCase):
+    def test_log_exp_tables_are_inverse(self) -> None:
+        self.assertEqual(sorted(BECH32_EXP[:31]), list(range(1, 32)))
+        self.assertEqual(BECH32_EXP[31:], BECH32_EXP[:31])
+        for value in range(1, 32):
+            self.assertEqual(BECH32_EXP[BECH32_LOG[value]], value)
+
+    def test_mul_table_matches_reference_for_all_pairs(self) -> None:
+        self.assertEqual(len(BECH32_MUL_TABLE), 1024)
+        for a in range(32):
+            for b in range(32):
+                self.assertEqual(bech32_mul(a, b), _reference_mul(a, b), (a, b))
+
+    def test_inverse_table(self) -> None:
+        for value in range(1, 32):
+            self.assertEqual(bech32_mul(value, BECH32_INV[value]), 1, value)
+
+
+class TestBech32Lagrange(unittest.TestCase):
+    def test_weights_sum_to_one(self) -> None:
+        # Interpolating a constant must return it, so the weights XOR to 1
+        indices = [CHARSET_MAP[c] for c in "acd"]
+        for x in (CHARSET_MAP["s"], CHARSET_MAP["e"]):
+            total = 0
+            for weight in bech32_lagrange(indices, x):
+                total ^= weight
+            self.assertEqual(total, 1)
+
+    def test_weights_follow_index_order(self) -> None:
+        x = CHARSET_MAP["s"]
+        forward = bech32_lagrange([CHARSET_MAP[c] for c in "acd"], x)
+        reverse = bech32_lagrange([CHARSET_MAP[c] for c in "dca"], x)
+        self.assertEqual(reverse, forward[::-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
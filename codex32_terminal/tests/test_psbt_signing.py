@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from base64 import b64decode, b64encode
+import os
 import sys
 import tempfile
 import unittest
@@ -28,9 +29,17 @@ SEED_B = bytes.fromhex("ffeeddccbbaa99887766554433221100")
 
 
 class TestPsbtSigningHelpers(unittest.TestCase):
-    def _build_unsigned_single_sig_psbt(self, seed_bytes: bytes) -> psbt.PSBT:
-        """Create a minimal unsigned p2wpkh PSBT owned by the provided seed."""
-        root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS["main"]["xprv"])
+    @classmethod
+    def setUpClass(cls) -> None:
+        # HD derivation dominates setup; build and serialize SEED_A's PSBT once per class
+        root = bip32.HDKey.from_seed(SEED_A, version=NETWORKS["main"]["xprv"])
+        cls._raw_a = cls._build_unsigned_single_sig_psbt(root).serialize()
+        cls._b64_a = b64encode(cls._raw_a).decode("ascii")
+        cls._hex_a = cls._raw_a.hex()
+
+    @staticmethod
+    def _build_unsigned_single_sig_psbt(root: bip32.HDKey) -> psbt.PSBT:
+        """Create a minimal unsigned p2wpkh PSBT spending from root's m/84h/0h/0h/0/0 key."""
         child = root.derive("m/84h/0h/0h/0/0")
         pubkey = child.key.get_public_key()
         script_pubkey = script.p2wpkh(pubkey)
@@ -48,10 +57,9 @@ class TestPsbtSigningHelpers(unittest.TestCase):
         return unsigned_psbt
 
     def test_parse_psbt_input_base64_hex_and_file(self) -> None:
-        unsigned = self._build_unsigned_single_sig_psbt(SEED_A)
-        raw = unsigned.serialize()
-        psbt_base64 = b64encode(raw).decode("ascii")
-        psbt_hex = raw.hex()
+        raw = self._raw_a
+        psbt_base64 = self._b64_a
+        psbt_hex = self._hex_a
 
         parsed_from_b64 = parse_psbt_input(psbt_base64)
         self.assertEqual(parsed_from_b64.serialize(), raw)
@@ -61,29 +69,40 @@ class TestPsbtSigningHelpers(unittest.TestCase):
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-
-            b64_file = temp_path / "unsigned_b64.txt"
-            b64_file.write_text(psbt_base64, encoding="utf-8")
-            parsed_from_b64_file = parse_psbt_input(str(b64_file))
-            self.assertEqual(parsed_from_b64_file.serialize(), raw)
-
-            hex_file = temp_path / "unsigned_hex.txt"
-            hex_file.write_text(psbt_hex, encoding="utf-8")
-            parsed_from_hex_file = parse_psbt_input(str(hex_file))
-            self.assertEqual(parsed_from_hex_file.serialize(), raw)
-
-            raw_file = temp_path / "unsigned.psbt"
-            raw_file.write_bytes(raw)
-            parsed_from_raw_file = parse_psbt_input(str(raw_file))
-            self.assertEqual(parsed_from_raw_file.serialize(), raw)
+            for name, payload in (
+                ("unsigned_b64.txt", psbt_base64.encode("ascii")),
+                ("unsigned_hex.txt", psbt_hex.encode("ascii")),
+                ("unsigned.psbt", raw),
+            ):
+                with self.subTest(name=name):
+                    psbt_file = temp_path / name
+                    psbt_file.write_bytes(payload)
+                    self.assertEqual(parse_psbt_input(str(psbt_file)).serialize(), raw)
+
+    def test_parse_psbt_input_multiline_text(self) -> None:
+        for name, text in (("base64", self._b64_a), ("hex", self._hex_a)):
+            with self.subTest(name=name):
+                wrapped = "\n".join(text[i : i + 64] for i in range(0, len(text), 64))
+                self.assertEqual(parse_psbt_input(wrapped).serialize(), self._raw_a)
+
+    def test_parse_psbt_input_file_named_with_magic_prefix(self) -> None:
+        previous_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                for name in ("70736274_export.psbt", "cHNidP_export.psbt"):
+                    with self.subTest(name=name):
+                        Path(name).write_bytes(self._raw_a)
+                        self.assertEqual(parse_psbt_input(name).serialize(), self._raw_a)
+            finally:
+                os.chdir(previous_cwd)
 
     def test_parse_psbt_input_invalid_raises(self) -> None:
         with self.assertRaises(Codex32InputError):
             parse_psbt_input("this-is-not-a-psbt")
 
     def test_sign_psbt_with_matching_seed_adds_signature(self) -> None:
-        unsigned = self._build_unsigned_single_sig_psbt(SEED_A)
-        unsigned_base64 = b64encode(unsigned.serialize()).decode("ascii")
+        unsigned_base64 = self._b64_a
 
         result = sign_psbt_with_seed(
             seed_bytes=SEED_A,
@@ -112,8 +131,7 @@ class TestPsbtSigningHelpers(unittest.TestCase):
             )
 
     def test_sign_psbt_with_wrong_seed_fails(self) -> None:
-        unsigned = self._build_unsigned_single_sig_psbt(SEED_A)
-        unsigned_base64 = b64encode(unsigned.serialize()).decode("ascii")
+        unsigned_base64 = self._b64_a
 
         with self.assertRaises(Codex32InputError):
             sign_psbt_with_seed(
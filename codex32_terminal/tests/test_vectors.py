@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from base64 import b64encode
+import contextlib
+import io
 import sys
 from pathlib import Path
 
@@ -14,13 +16,21 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.append(str(ROOT / "src"))
 
 from model import (  # noqa: E402
+    Codex32InputError,
+    build_all_single_sig_exports,
     build_multisig_cosigner_export,
+    build_single_sig_export,
+    codex32_share_to_seed_bytes,
     codex32_to_seed_bytes,
     get_seed_fingerprint,
+    parse_codex32_share,
+    recover_secret_share,
     sign_psbt_with_seed,
 )
 
 
+SINGLE_SIG_PURPOSES = {"nested": 49, "native": 84, "taproot": 86}
+
 VECTORS = {
     "vector2": {
         "codex32": "MS12NAMES6XQGUZTTXKEQNJSJZV4JV3NZ5K3KWGSPHUH6EVW",
@@ -29,11 +39,16 @@ VECTORS = {
     "vector3": {
         "codex32": "ms13cashsllhdmn9m42vcsamx24zrxgs3qqjzqud4m0d6nln",
         "seed_hex": "ffeeddccbbaa99887766554433221100",
+        "shares": [
+            "ms13casha320zyxwvutsrqpnmlkjhgfedca2a8d0zehn8a0t",
+            "ms13cashcacdefghjklmnpqrstuvwxyz023949xq35my48dr",
+            "ms13cashd0wsedstcdcts64cd7wvy4m90lm28w4ffupqs7rm",
+        ],
     },
 }
 
 
-def main() -> None:
+def run_vectors() -> None:
     for name, vector in VECTORS.items():
         seed_bytes = codex32_to_seed_bytes(vector["codex32"])
         expected = bytes.fromhex(vector["seed_hex"])
@@ -43,12 +58,31 @@ def main() -> None:
             )
         fp_mainnet = get_seed_fingerprint(seed_bytes, "mainnet")
         fp_testnet4 = get_seed_fingerprint(seed_bytes, "testnet4")
+        root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS["main"]["xprv"])
+
+        # Check the batch exports against xpubs derived directly with embit
+        batch_exports = build_all_single_sig_exports(seed_bytes, "mainnet")
+        if set(batch_exports) != set(SINGLE_SIG_PURPOSES):
+            raise AssertionError(f"{name}: batch export script types {sorted(batch_exports)}")
+        for script_type, purpose in SINGLE_SIG_PURPOSES.items():
+            export = batch_exports[script_type]
+            expected_xpub = root.derive(f"m/{purpose}h/0h/0h").to_public().to_string(
+                version=NETWORKS["main"]["xpub"]
+            )
+            if export["xpub"] != expected_xpub:
+                raise AssertionError(f"{name}: batch {script_type} xpub mismatch")
+            expected_key = f"[{fp_mainnet}/{purpose}'/0'/0']{expected_xpub}/0/*"
+            if expected_key not in export["receive_descriptor"]:
+                raise AssertionError(f"{name}: batch {script_type} receive descriptor mismatch")
+            if export != build_single_sig_export(seed_bytes, script_type, "mainnet"):
+                raise AssertionError(f"{name}: batch {script_type} export mismatch")
         ms_nested = build_multisig_cosigner_export(
             seed_bytes=seed_bytes,
             script_type="nested",
             network="mainnet",
             threshold=2,
             total_cosigners=3,
+            root=root,
         )
         if ms_nested["derivation_path"] != "m/48'/0'/0'/1'":
             raise AssertionError(
@@ -72,7 +106,6 @@ def main() -> None:
             raise AssertionError(f"{name}: expected receive descriptor template for multisig export")
 
         # Phase D smoke test: build a simple p2wpkh PSBT for this seed and sign it
-        root = bip32.HDKey.from_seed(seed_bytes, version=NETWORKS["main"]["xprv"])
         child = root.derive("m/84h/0h/0h/0/0")
         pubkey = child.key.get_public_key()
         script_pubkey = script.p2wpkh(pubkey)
@@ -104,5 +137,37 @@ def main() -> None:
         )
 
 
+def run_share_to_seed_checks() -> None:
+    vector = VECTORS["vector3"]
+    shares = [parse_codex32_share(share) for share in vector["shares"]]
+
+    try:
+        codex32_share_to_seed_bytes(shares[0])
+    except Codex32InputError:
+        pass
+    else:
+        raise AssertionError("vector3: non-S share was accepted as a seed")
+
+    secret = recover_secret_share(shares)
+    seed_bytes = codex32_share_to_seed_bytes(secret)
+    if seed_bytes != codex32_to_seed_bytes(secret.s):
+        raise AssertionError("vector3: parsed and string S-share seed bytes differ")
+    if seed_bytes.hex() != vector["seed_hex"]:
+        raise AssertionError(f"vector3: recovered seed mismatch. got={seed_bytes.hex()}")
+
+    print("vector3: share recovery -> seed bytes OK")
+
+
+def main() -> None:
+    # Collect per-vector status lines and write them out once
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            run_vectors()
+            run_share_to_seed_checks()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
 if __name__ == "__main__":
     main()